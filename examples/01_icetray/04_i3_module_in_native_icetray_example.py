@@ -47,7 +47,15 @@ def apply_to_files(
 
     The new i3 files will appear as copies of the original i3 files but with
     reconstructions added. Original i3 files are left untouched.
+
+    The `modules` are constructed once by the caller and re-used for all
+    files, such that models are only loaded once.
     """
+    for i3_module in modules:
+        assert isinstance(
+            i3_module, GraphNeTI3Module
+        ), f"Expected an instance of GraphNeTI3Module. Got {type(i3_module)}."
+
     for i3_file in i3_files:
         tray = I3Tray()
         tray.context["I3FileStager"] = dataio.get_stagers()
@@ -22,7 +22,6 @@ INSTALL_REQUIRES = [
     "ruamel.yaml",
     "scikit_learn>=1.0",
     "scipy>=1.7",
-    "sqlalchemy>=1.4",
     "timer>=0.2",
     "tqdm>=4.64",
     "wandb>=0.12",
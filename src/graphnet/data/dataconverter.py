@@ -59,10 +59,19 @@ class FileSet:  # noqa: D101
 
 
 # Utility method(s)
-def init_global_index(index: Synchronized, output_files: List[str]) -> None:
-    """Make `global_index` available to pool workers."""
-    global global_index, global_output_files  # type: ignore[name-defined]
-    global_index, global_output_files = (index, output_files)  # type: ignore[name-defined]
+def init_global_index(
+    index: Synchronized,
+    output_files: List[str],
+    extractors: I3ExtractorCollection,
+) -> None:
+    """Make `global_index` and worker-local `global_extractors` available.
+
+    The extractors are sent to each pool worker once, such that, e.g., GCD data
+    loaded by them is kept for all files processed by the worker rather than
+    being discarded with the copy of the converter sent with each task.
+    """
+    global global_index, global_output_files, global_extractors  # type: ignore[name-defined]
+    global_index, global_output_files, global_extractors = (index, output_files, extractors)  # type: ignore[name-defined]
 
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -327,8 +336,11 @@ class DataConverter(ABC, LoggerMixin):
         map_fn, pool = self.get_map_function(len(args))
 
         # Iterate over files
-        for _ in map_fn(
-            self._process_file, tqdm(args, unit="file(s)", colour="green")
+        for _ in tqdm(
+            map_fn(self._process_file, args),
+            total=len(args),
+            unit="file(s)",
+            colour="green",
         ):
             self.debug(
                 "Saving with 1:1 strategy on the individual worker processes"
@@ -344,8 +356,11 @@ class DataConverter(ABC, LoggerMixin):
         map_fn, pool = self.get_map_function(len(args), unit="batch(es)")
 
         # Iterate over batches of files
-        for _ in map_fn(
-            self._process_batch, tqdm(args, unit="batch(es)", colour="green")
+        for _ in tqdm(
+            map_fn(self._process_batch, args),
+            total=len(args),
+            unit="batch(es)",
+            colour="green",
         ):
             self.debug("Saving with batched strategy")
 
@@ -363,7 +378,7 @@ class DataConverter(ABC, LoggerMixin):
         """
         if pool:
             # Extract information from shared variables to member variables.
-            index, output_files = pool._initargs  # type: ignore
+            index, output_files, _ = pool._initargs  # type: ignore
             self._index += index.value
             self._output_files.extend(list(sorted(output_files[:])))
 
@@ -421,7 +436,13 @@ class DataConverter(ABC, LoggerMixin):
         except NameError:
             multi_processing = False
 
-        self._extractors.set_files(fileset.i3_file, fileset.gcd_file)
+        # Use the extractors kept on the worker process, if any
+        if multi_processing:
+            extractors = global_extractors  # type: ignore[name-defined]
+        else:
+            extractors = self._extractors
+
+        extractors.set_files(fileset.i3_file, fileset.gcd_file)
         i3_file_io = dataio.I3File(fileset.i3_file, "r")
         data = list()
         while i3_file_io.more():
@@ -431,30 +452,32 @@ class DataConverter(ABC, LoggerMixin):
                 continue
 
             # Extract data from I3Frame
-            results = self._extractors(frame)
+            results = extractors(frame)
             data_dict = OrderedDict(zip(self._table_names, results))
 
             # If an I3GenericExtractor is used, we want each automatically
             # parsed key to be stored as a separate table.
-            for extractor in self._extractors:
+            for extractor in extractors:
                 if isinstance(extractor, I3GenericExtractor):
                     data_dict.update(data_dict.pop(extractor._name))
 
-            # Get new, unique index and increment value
-            if multi_processing:
-                with global_index.get_lock():  # type: ignore[name-defined]
-                    index = global_index.value  # type: ignore[name-defined]
-                    global_index.value += 1  # type: ignore[name-defined]
-            else:
-                index = self._index
-                self._index += 1
+            data.append(data_dict)
 
-            # Attach index to all tables
+        # Reserve a contiguous range of new, unique indices for all events in
+        # the file, such that the shared counter is only locked once per file.
+        if multi_processing:
+            with global_index.get_lock():  # type: ignore[name-defined]
+                first_index = global_index.value  # type: ignore[name-defined]
+                global_index.value += len(data)  # type: ignore[name-defined]
+        else:
+            first_index = self._index
+            self._index += len(data)
+
+        # Attach index to all tables
+        for index, data_dict in enumerate(data, start=first_index):
             for table in data_dict.keys():
                 data_dict[table][self._index_column] = index
 
-            data.append(data_dict)
-
         return data
 
     def get_map_function(
@@ -469,15 +492,15 @@ class DataConverter(ABC, LoggerMixin):
             )
 
             manager = Manager()
-            index = Value("i", 0)
+            index = Value("q", 0)
             output_files = manager.list()
 
             pool = Pool(
                 processes=workers,
                 initializer=init_global_index,
-                initargs=(index, output_files),
+                initargs=(index, output_files, self._extractors),
             )
-            map_fn = pool.imap
+            map_fn = pool.imap_unordered
 
         else:
             self.info(
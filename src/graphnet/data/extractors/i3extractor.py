@@ -38,9 +38,13 @@ class I3Extractor(ABC, LoggerMixin):
         # @TODO: Is it necessary to set the `i3_file`? It is only used in one
         #        place in `I3TruthExtractor`, and there only in a way that might
         #        be solved another way.
+        # Consecutive I3 files typically share the same GCD file, in which case
+        # the geospatial information already loaded can be reused.
+        reload_gcd = (gcd_file or i3_file) != (self._gcd_file or self._i3_file)
         self._i3_file = i3_file
         self._gcd_file = gcd_file
-        self._load_gcd_data()
+        if reload_gcd:
+            self._load_gcd_data()
 
     def _load_gcd_data(self) -> None:
         """Load the geospatial information contained in the GCD-file."""
@@ -124,27 +124,32 @@ class I3FeatureExtractorIceCube86(I3FeatureExtractor):
             else:
                 is_errata_dom = int(padding_value)
 
-            # Loop over pulses for each OM
-            pulses = data[om_key]
-            for pulse in pulses:
-                output["charge"].append(
-                    getattr(pulse, "charge", padding_value)
-                )
-                output["dom_time"].append(
-                    getattr(pulse, "time", padding_value)
-                )
-                output["width"].append(getattr(pulse, "width", padding_value))
-                output["pmt_area"].append(area)
-                output["rde"].append(rde)
-                output["dom_x"].append(x)
-                output["dom_y"].append(y)
-                output["dom_z"].append(z)
-                # DOM flags
-                output["is_bright_dom"].append(is_bright_dom)
-                output["is_bad_dom"].append(is_bad_dom)
-                output["is_saturated_dom"].append(is_saturated_dom)
-                output["is_errata_dom"].append(is_errata_dom)
-                output["event_time"].append(event_time)
+            # Values for each pulse. The pulse series is converted to a list
+            # once, rather than walking the wrapped C++ container per feature.
+            pulses = list(data[om_key])
+            output["charge"].extend(
+                [getattr(pulse, "charge", padding_value) for pulse in pulses]
+            )
+            output["dom_time"].extend(
+                [getattr(pulse, "time", padding_value) for pulse in pulses]
+            )
+            output["width"].extend(
+                [getattr(pulse, "width", padding_value) for pulse in pulses]
+            )
+
+            # Common values are repeated once for each pulse on the OM
+            nb_pulses = len(pulses)
+            output["pmt_area"].extend([area] * nb_pulses)
+            output["rde"].extend([rde] * nb_pulses)
+            output["dom_x"].extend([x] * nb_pulses)
+            output["dom_y"].extend([y] * nb_pulses)
+            output["dom_z"].extend([z] * nb_pulses)
+            # DOM flags
+            output["is_bright_dom"].extend([is_bright_dom] * nb_pulses)
+            output["is_bad_dom"].extend([is_bad_dom] * nb_pulses)
+            output["is_saturated_dom"].extend([is_saturated_dom] * nb_pulses)
+            output["is_errata_dom"].extend([is_errata_dom] * nb_pulses)
+            output["event_time"].extend([event_time] * nb_pulses)
 
         return output
 
@@ -217,16 +222,15 @@ class I3FeatureExtractorIceCubeUpgrade(I3FeatureExtractorIceCube86):
             pmt_number = om_key[2]
             dom_type = self._gcd_dict[om_key].omtype
 
-            # Loop over pulses for each OM
-            pulses = data[om_key]
-            for _ in pulses:
-                output["string"].append(string)
-                output["pmt_number"].append(pmt_number)
-                output["dom_number"].append(dom_number)
-                output["pmt_dir_x"].append(pmt_dir_x)
-                output["pmt_dir_y"].append(pmt_dir_y)
-                output["pmt_dir_z"].append(pmt_dir_z)
-                output["dom_type"].append(dom_type)
+            # Common values are repeated once for each pulse on the OM
+            nb_pulses = len(data[om_key])
+            output["string"].extend([string] * nb_pulses)
+            output["pmt_number"].extend([pmt_number] * nb_pulses)
+            output["dom_number"].extend([dom_number] * nb_pulses)
+            output["pmt_dir_x"].extend([pmt_dir_x] * nb_pulses)
+            output["pmt_dir_y"].extend([pmt_dir_y] * nb_pulses)
+            output["pmt_dir_z"].extend([pmt_dir_z] * nb_pulses)
+            output["dom_type"].extend([dom_type] * nb_pulses)
 
         return output
 
@@ -265,9 +269,6 @@ class I3PulseNoiseTruthFlagIceCubeUpgrade(I3FeatureExtractorIceCube86):
             return output
 
         for om_key in om_keys:
-            # Loop over pulses for each OM
-            pulses = data[om_key]
-            for truth_flag in pulses:
-                output["truth_flag"].append(truth_flag)
+            output["truth_flag"].extend(data[om_key])
 
         return output
@@ -5,6 +5,9 @@ import os
 from typing import List, Optional
 
 import awkward
+import pyarrow as pa
+import pyarrow.parquet as pq
+from tqdm import tqdm
 
 from graphnet.data.dataconverter import DataConverter  # type: ignore[attr-defined]
 
@@ -14,6 +17,8 @@ class ParquetDataConverter(DataConverter):
 
     # Class variables
     file_suffix: str = "parquet"
+    compression: str = "zstd"
+    compression_level: int = 3
 
     # Abstract method implementation(s)
     def save_data(self, data: List[OrderedDict], output_file: str) -> None:
@@ -29,24 +34,193 @@ class ParquetDataConverter(DataConverter):
             f"- Data has {len(data)} events and {len(data[0])} tables for each"
         )
 
-        awkward.to_parquet(awkward.from_iter(data), output_file)
+        awkward.to_parquet(
+            awkward.from_iter(data),
+            output_file,
+            compression=self.compression,
+            compression_level=self.compression_level,
+        )
 
         self.debug("- Done saving")
-        self._output_files.append(output_file)
 
     def merge_files(
         self, output_file: str, input_files: Optional[List[str]] = None
     ) -> None:
         """Parquet-specific method for merging output files.
 
+        The input files are read and written one at a time, such that the full
+        data set is never held in memory.
+
         Args:
             output_file: Name of the output file containing the merged results.
             input_files: Intermediate files to be merged, according to the
                 specific implementation. Default to None, meaning that all
                 files output by the current instance are merged.
-
-        Raises:
-            NotImplementedError: If the method has not been implemented for the
-                Parquet backend.
         """
-        raise NotImplementedError()
+        if input_files is None:
+            self.info("Merging files output by current instance.")
+            input_files = self._output_files
+
+        if not output_file.endswith("." + self.file_suffix):
+            output_file = ".".join([output_file, self.file_suffix])
+
+        if os.path.exists(output_file):
+            self.warning(
+                f"Target path for merged file, {output_file}, already exists. "
+                "Overwriting."
+            )
+
+        if len(input_files) == 0:
+            self.warning("No intermediate parquet files found!")
+            return
+
+        self.info(f"Merging {len(input_files)} parquet files")
+
+        # Inferred types may differ between files, e.g., if a field only
+        # contains integer padding values in some of them, or if some files
+        # contain additional fields. All files are therefore converted to a
+        # common schema.
+        schema = unify_schemas(
+            [pq.read_schema(input_file) for input_file in input_files]
+        )
+        with pq.ParquetWriter(
+            output_file,
+            schema,
+            compression=self.compression,
+            compression_level=self.compression_level,
+        ) as writer:
+            for input_file in tqdm(input_files, colour="green"):
+                table = pq.read_table(input_file)
+                writer.write_table(conform_table(table, schema))
+
+
+def unify_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """Get a common schema to which all of `schemas` can be converted.
+
+    Fields are matched by name, also within structs. Fields missing from some
+    of the schemas are made nullable, and numeric types are promoted, e.g.,
+    from integer to floating point.
+
+    Raises:
+        ValueError: If a field has types that cannot be unified.
+    """
+    unified = _unify_types([pa.struct(list(schema)) for schema in schemas])
+    return pa.schema(list(unified))
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Convert `table` to `schema`, e.g., as returned by `unify_schemas`.
+
+    Fields in `schema` that are missing from `table` are filled with nulls.
+    """
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            column = table.column(field.name)
+            chunks = [
+                _conform_array(chunk, field.type) for chunk in column.chunks
+            ]
+            columns.append(pa.chunked_array(chunks, type=field.type))
+        else:
+            columns.append(pa.nulls(len(table), field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _unify_types(types: List[pa.DataType]) -> pa.DataType:
+    """Get a common type to which all of `types` can be converted."""
+    # Null types, e.g., from lists that are empty in all events, carry no
+    # information about the type.
+    types = [type_ for type_ in types if not pa.types.is_null(type_)]
+    if len(types) == 0:
+        return pa.null()
+    if all(type_ == types[0] for type_ in types):
+        return types[0]
+
+    if all(pa.types.is_struct(type_) for type_ in types):
+        names: List[str] = []
+        for type_ in types:
+            names.extend(
+                field.name for field in type_ if field.name not in names
+            )
+        fields = []
+        for name in names:
+            matches = [
+                type_[type_.get_field_index(name)]
+                for type_ in types
+                if type_.get_field_index(name) != -1
+            ]
+            nullable = len(matches) < len(types) or any(
+                field.nullable for field in matches
+            )
+            fields.append(
+                pa.field(
+                    name,
+                    _unify_types([field.type for field in matches]),
+                    nullable=nullable,
+                )
+            )
+        return pa.struct(fields)
+
+    for is_list, list_ in (
+        (pa.types.is_list, pa.list_),
+        (pa.types.is_large_list, pa.large_list),
+    ):
+        if all(is_list(type_) for type_ in types):
+            value_fields = [type_.value_field for type_ in types]
+            return list_(
+                pa.field(
+                    value_fields[0].name,
+                    _unify_types([field.type for field in value_fields]),
+                    nullable=any(field.nullable for field in value_fields),
+                )
+            )
+
+    if all(
+        pa.types.is_integer(type_)
+        or pa.types.is_floating(type_)
+        or pa.types.is_boolean(type_)
+        for type_ in types
+    ):
+        if any(pa.types.is_floating(type_) for type_ in types):
+            return pa.float64()
+        return pa.int64()
+
+    raise ValueError(f"Cannot merge fields with incompatible types {types}.")
+
+
+def _conform_array(array: pa.Array, type_: pa.DataType) -> pa.Array:
+    """Convert `array` to `type_`, matching struct fields by name."""
+    if array.type == type_:
+        return array
+
+    mask = array.is_null() if array.null_count > 0 else None
+    if pa.types.is_null(array.type):
+        return pa.nulls(len(array), type_)
+
+    if pa.types.is_struct(type_):
+        children = dict(
+            zip([field.name for field in array.type], array.flatten())
+        )
+        return pa.StructArray.from_arrays(
+            [
+                _conform_array(children[field.name], field.type)
+                if field.name in children
+                else pa.nulls(len(array), field.type)
+                for field in type_
+            ],
+            fields=list(type_),
+            mask=mask,
+        )
+
+    if pa.types.is_list(type_) or pa.types.is_large_list(type_):
+        list_class = (
+            pa.ListArray if pa.types.is_list(type_) else pa.LargeListArray
+        )
+        return list_class.from_arrays(
+            array.offsets,
+            _conform_array(array.values, type_.value_type),
+            type=type_,
+            mask=mask,
+        )
+
+    return array.cast(type_)
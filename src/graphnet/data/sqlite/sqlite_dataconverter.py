@@ -1,18 +1,21 @@
 """DataConverter for the SQLite backend."""
 
 from collections import OrderedDict
+from numbers import Number
 import os
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import pandas as pd
-import sqlalchemy
+import numpy as np
 import sqlite3
 from tqdm import tqdm
 
 from graphnet.data.dataconverter import DataConverter  # type: ignore[attr-defined]
 from graphnet.data.sqlite.sqlite_utilities import (
+    attach_index,
+    connect_to_database,
     create_table,
     create_table_and_save_to_sql,
+    reset_journal_mode,
 )
 
 
@@ -31,44 +34,51 @@ class SQLiteDataConverter(DataConverter):
                 f"Output file {output_file} already exists. Appending."
             )
 
-        # Concatenate data
+        # Collect the data for each table in columnar format, such that all
+        # rows of each table are inserted at once, directly from the lists.
         assert len(data)
-        dataframe = OrderedDict([(key, pd.DataFrame()) for key in data[0]])
+        columns: Dict[str, Dict[str, List[Any]]] = OrderedDict(
+            [(key, OrderedDict()) for key in data[0]]
+        )
+        nb_rows = {key: 0 for key in data[0]}
         for data_dict in data:
+            # only include data_dict in temp. databases if at least one pulsemap is non-empty,
+            # and the current extractor is also non-empty (also since truth is always non-empty)
+            if not self.any_pulsemap_is_non_empty(data_dict):
+                continue
             for key, data_values in data_dict.items():
-                df = construct_dataframe(data_values)
-
-                if self.any_pulsemap_is_non_empty(data_dict) and len(df) > 0:
-                    # only include data_dict in temp. databases if at least one pulsemap is non-empty,
-                    # and the current extractor (df) is also non-empty (also since truth is always non-empty)
-                    if len(dataframe[key]):
-                        assert isinstance(dataframe[key], pd.DataFrame)
-                        dataframe[key] = dataframe[key].append(
-                            df, ignore_index=True, sort=True
-                        )
-                    else:
-                        dataframe[key] = df
+                if key not in columns:
+                    columns[key] = OrderedDict()
+                    nb_rows[key] = 0
+                nb_rows[key] += extend_columns(
+                    columns[key], nb_rows[key], data_values
+                )
+
+        # Save each table to SQLite database, using a single connection
+        tables = [table for table in columns if nb_rows[table] > 0]
+        if len(tables) == 0:
+            self.warning(f"No data saved to {output_file}")
+            return
 
-        # Save each dataframe to SQLite database
         self.debug(f"Saving to {output_file}")
-        saved_any = False
-        for table, df in dataframe.items():
-            if len(df) > 0:
+        conn = connect_to_database(output_file)
+        try:
+            for table in tables:
                 create_table_and_save_to_sql(
-                    df,
+                    columns[table],
                     table,
                     output_file,
                     default_type="FLOAT",
                     integer_primary_key=not (
                         is_pulse_map(table) or is_mc_tree(table)
                     ),
+                    conn=conn,
                 )
-                saved_any = True
+            reset_journal_mode(conn)
+        finally:
+            conn.close()
 
-        if saved_any:
-            self.debug("- Done saving")
-        else:
-            self.warning(f"No data saved to {output_file}")
+        self.debug("- Done saving")
 
     def merge_files(
         self, output_file: str, input_files: Optional[List[str]] = None
@@ -98,39 +108,77 @@ class SQLiteDataConverter(DataConverter):
 
             # Create one empty database table for each extraction
             table_names = self._extract_table_names(input_files)
-            for table_name in table_names:
-                column_names = self._extract_column_names(
-                    input_files, table_name
-                )
-                if len(column_names) > 1:
-                    create_table(
-                        column_names,
-                        table_name,
-                        output_file,
-                        default_type="FLOAT",
-                        integer_primary_key=not (
-                            is_pulse_map(table_name) or is_mc_tree(table_name)
-                        ),
+            indexed_tables = []
+            conn = connect_to_database(output_file)
+            try:
+                for table_name in table_names:
+                    column_names = self._extract_column_names(
+                        input_files, table_name
                     )
+                    if len(column_names) > 1:
+                        integer_primary_key = not (
+                            is_pulse_map(table_name) or is_mc_tree(table_name)
+                        )
+                        create_table(
+                            column_names,
+                            table_name,
+                            output_file,
+                            default_type="FLOAT",
+                            integer_primary_key=integer_primary_key,
+                            create_index=False,
+                            conn=conn,
+                        )
+                        if not integer_primary_key:
+                            indexed_tables.append(table_name)
+            finally:
+                conn.close()
 
             # Merge temporary databases into newly created one
             self._merge_temporary_databases(output_file, input_files)
+
+            # Index pulse map-like tables only once all rows are inserted
+            self._finalize_indexes(output_file, indexed_tables)
         else:
             self.warning("No temporary database files found!")
 
     # Internal methods
+    def _finalize_indexes(
+        self, database_path: str, table_names: List[str]
+    ) -> None:
+        """Attach the event index to each of `table_names`.
+
+        Should be called after all rows have been inserted into the tables. The
+        journal mode of the database is reset afterwards, since the database is
+        finished.
+        """
+        conn = connect_to_database(database_path)
+        try:
+            for table_name in table_names:
+                self.debug(f"Creating index on {table_name}")
+                attach_index(
+                    database_path, table_name, analyze=True, conn=conn
+                )
+            reset_journal_mode(conn)
+        finally:
+            conn.close()
+
     def _get_tables_in_database(self, db: str) -> Tuple[str, ...]:
-        with sqlite3.connect(db) as conn:
+        # Internal tables, e.g., the statistics from `ANALYZE`, are excluded.
+        conn = sqlite3.connect(db)
+        try:
             table_names = tuple(
                 [
                     p[0]
                     for p in (
                         conn.execute(
-                            "SELECT name FROM sqlite_master WHERE type='table';"
+                            "SELECT name FROM sqlite_master WHERE type='table' "
+                            "AND name NOT GLOB 'sqlite_*';"
                         ).fetchall()
                     )
                 ]
             )
+        finally:
+            conn.close()
         return table_names
 
     def _extract_table_names(
@@ -154,14 +202,24 @@ class SQLiteDataConverter(DataConverter):
     def _extract_column_names(
         self, db_paths: List[str], table_name: str
     ) -> List[str]:
+        """Get the column names of `table_name` from `db_paths`.
+
+        The columns are taken from the first database containing the table.
+        """
         for db_path in db_paths:
-            tables_in_database = self._get_tables_in_database(db_path)
-            if table_name in tables_in_database:
-                with sqlite3.connect(db_path) as con:
-                    query = f"select * from {table_name} limit 1"
-                    columns = pd.read_sql(query, con).columns
-                if len(columns):
-                    return columns
+            # Returns no rows if the table doesn't exist in the database.
+            conn = sqlite3.connect(db_path)
+            try:
+                columns = [
+                    p[1]
+                    for p in conn.execute(
+                        f"PRAGMA table_info({table_name});"
+                    ).fetchall()
+                ]
+            finally:
+                conn.close()
+            if len(columns):
+                return columns
         return []
 
     def any_pulsemap_is_non_empty(self, data_dict: Dict[str, Dict]) -> bool:
@@ -180,73 +238,136 @@ class SQLiteDataConverter(DataConverter):
         pulsemap_dicts = [data_dict[pulsemap] for pulsemap in self._pulsemaps]
         return any(d["dom_x"] for d in pulsemap_dicts)
 
-    def _submit_to_database(
-        self, database: str, key: str, data: pd.DataFrame
+    def _merge_temporary_databases(
+        self,
+        output_file: str,
+        input_files: List[str],
     ) -> None:
-        """Submit data to the database with specified key."""
-        if len(data) == 0:
-            self.info(f"No data provided for {key}.")
-            return
-        engine = sqlalchemy.create_engine("sqlite:///" + database)
-        data.to_sql(key, engine, index=False, if_exists="append")
-        engine.dispose()
+        """Merge the temporary databases.
 
-    def _extract_everything(self, db: str) -> "OrderedDict[str, pd.DataFrame]":
-        """Extract everything from the temporary database `db`.
+        Each temporary database is attached to the output database, such that
+        the rows of each table are copied by SQLite directly, without passing
+        through python. Only tables already present in the output database
+        are copied.
 
         Args:
-            db: Path to temporary database.
-
-        Returns:
-            Dictionary containing the data for each extracted table.
+            output_file: path to the final database
+            input_files: list of names of temporary databases
         """
-        results = OrderedDict()
-        table_names = self._extract_table_names(db)
-        with sqlite3.connect(db) as conn:
-            for table_name in table_names:
-                query = f"select * from {table_name}"
+        output_tables = self._get_tables_in_database(output_file)
+        conn = connect_to_database(output_file)
+        try:
+            for input_file in tqdm(input_files, colour="green"):
+                conn.execute("ATTACH DATABASE ? AS input_db;", (input_file,))
+                conn.execute("BEGIN TRANSACTION;")
                 try:
-                    data = pd.read_sql(query, conn)
-                except:  # noqa: E722
-                    data = []
-                results[table_name] = data
-        return results
-
-    def _merge_temporary_databases(
+                    self._copy_tables(conn, output_file, output_tables)
+                    conn.execute("COMMIT TRANSACTION;")
+                except Exception:
+                    conn.execute("ROLLBACK TRANSACTION;")
+                    raise
+                finally:
+                    conn.execute("DETACH DATABASE input_db;")
+        finally:
+            conn.close()
+
+    def _copy_tables(
         self,
+        conn: sqlite3.Connection,
         output_file: str,
-        input_files: List[str],
+        output_tables: Tuple[str, ...],
     ) -> None:
-        """Merge the temporary databases.
+        """Copy rows of all tables in `output_tables` from `input_db`.
 
         Args:
-            output_file: path to the final database
-            input_files: list of names of temporary databases
+            conn: Connection to the output database, with the input database
+                attached as `input_db`.
+            output_file: path to the output database.
+            output_tables: names of the tables in the output database.
         """
-        for input_file in tqdm(input_files, colour="green"):
-            results = self._extract_everything(input_file)
-            for table_name, data in results.items():
-                self._submit_to_database(output_file, table_name, data)
+        table_names = [
+            p[0]
+            for p in conn.execute(
+                "SELECT name FROM input_db.sqlite_master WHERE type='table';"
+            ).fetchall()
+        ]
+        for table_name in table_names:
+            if table_name not in output_tables:
+                self.debug(
+                    f"Table {table_name} not in {output_file}. Skipping."
+                )
+                continue
+            columns = ", ".join(
+                [
+                    p[1]
+                    for p in conn.execute(
+                        f"PRAGMA input_db.table_info({table_name});"
+                    ).fetchall()
+                ]
+            )
+            conn.execute(
+                f"INSERT INTO main.{table_name} ({columns}) "
+                f"SELECT {columns} FROM input_db.{table_name};"
+            )
 
 
 # Implementation-specific utility function(s)
-def construct_dataframe(extraction: Dict[str, Any]) -> pd.DataFrame:
-    """Convert extraction to pandas.DataFrame.
+def extend_columns(
+    columns: Dict[str, List[Any]], nb_rows: int, extraction: Dict[str, Any]
+) -> int:
+    """Append `extraction` to the column-wise data in `columns`.
+
+    Scalar values (e.g., the event index) are repeated for each row if
+    `extraction` contains sequences, i.e., lists, tuples, or one-dimensional
+    arrays, and columns missing from either `columns` or `extraction` are
+    padded with `None`.
 
     Args:
+        columns: Data collected so far, with one list per column.
+        nb_rows: Number of rows collected so far.
         extraction: Dictionary with the extracted data.
 
     Returns:
-        Extraction as pandas.DataFrame.
+        Number of rows appended.
     """
-    all_scalars = True
-    for value in extraction.values():
-        if isinstance(value, (list, tuple, dict)):
-            all_scalars = False
-            break
-
-    out = pd.DataFrame(extraction, index=[0] if all_scalars else None)
-    return out
+    sequences: Dict[str, Any] = {}
+    for column, value in extraction.items():
+        if isinstance(value, np.ndarray):
+            assert (
+                value.ndim == 1
+            ), f"Array in column '{column}' must be one-dimensional."
+            sequences[column] = value.tolist()
+        elif isinstance(value, (list, tuple)):
+            sequences[column] = value
+        else:
+            assert value is None or isinstance(
+                value, (str, bytes, Number, np.generic)
+            ), (
+                f"Value in column '{column}' must be a sequence or a scalar; "
+                f"got {type(value).__name__}."
+            )
+
+    lengths = [len(value) for value in sequences.values()]
+    nb_new_rows = lengths[0] if len(lengths) else 1
+    assert all(
+        length == nb_new_rows for length in lengths
+    ), "All sequences in the extraction must be of the same length."
+    if nb_new_rows == 0:
+        return 0
+
+    for column, value in extraction.items():
+        if column not in columns:
+            columns[column] = [None] * nb_rows
+        if column in sequences:
+            columns[column].extend(sequences[column])
+        else:
+            columns[column].extend([value] * nb_new_rows)
+
+    for values in columns.values():
+        if len(values) < nb_rows + nb_new_rows:
+            values.extend([None] * (nb_rows + nb_new_rows - len(values)))
+
+    return nb_new_rows
 
 
 def is_pulse_map(table_name: str) -> bool:
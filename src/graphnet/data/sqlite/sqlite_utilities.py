@@ -1,12 +1,47 @@
 """SQLite-specific utility functions for use in `graphnet.data`."""
 
+from contextlib import contextmanager
 import os.path
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
-import sqlalchemy
 import sqlite3
 
+# Settings applied to connections used for bulk-appending data. These trade
+# durability on power loss for write throughput, which is acceptable since an
+# interrupted conversion is re-run from scratch anyway. The page size only
+# takes effect for new databases, and must be set before enabling WAL. Unlike
+# the other settings, the journal mode is stored in the database file, so
+# databases should be reset to `JOURNAL_MODE_DEFAULT` when writing is done.
+BULK_WRITE_PRAGMAS = (
+    "PRAGMA page_size=65536;",
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA mmap_size=30000000000;",
+    "PRAGMA cache_size=-500000;",
+    "PRAGMA temp_store=MEMORY;",
+)
+
+# Journal mode for finished databases. WAL requires shared memory, which is
+# not supported on network file systems, and a writable directory for reading.
+JOURNAL_MODE_DEFAULT = "DELETE"
+
+# NumPy scalars, e.g., from extractors or object-dtype DataFrame columns, are
+# otherwise stored as BLOBs by `sqlite3`. `np.float64` subclasses `float` and
+# needs no adapter. Missing values in nullable pandas dtypes are stored as
+# NULL.
+for _typecode in np.typecodes["AllInteger"]:
+    sqlite3.register_adapter(np.dtype(_typecode).type, int)
+for _typecode in "efg":
+    sqlite3.register_adapter(np.dtype(_typecode).type, float)
+sqlite3.register_adapter(np.bool_, int)
+sqlite3.register_adapter(type(pd.NA), lambda _: None)
+
+# Page cache size used when building indexes, in KiB (i.e., 1 GB). Sorting
+# large tables within the cache avoids spilling to temporary files.
+INDEX_CACHE_SIZE = -1000000
+
 
 def database_exists(database_path: str) -> bool:
     """Check whether database exists at `database_path`."""
@@ -16,60 +51,193 @@ def database_exists(database_path: str) -> bool:
     return os.path.exists(database_path)
 
 
-def database_table_exists(database_path: str, table_name: str) -> bool:
+def database_table_exists(
+    database_path: str,
+    table_name: str,
+    *,
+    conn: Optional[sqlite3.Connection] = None,
+) -> bool:
     """Check whether `table_name` exists in database at `database_path`."""
-    if not database_exists(database_path):
+    if conn is None and not database_exists(database_path):
         return False
-    query = f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-    with sqlite3.connect(database_path) as conn:
-        result = pd.read_sql(query, conn)
+    query = "SELECT name FROM sqlite_master WHERE type='table' AND name=?;"
+    with _connection(database_path, conn) as conn_:
+        result = conn_.execute(query, (table_name,)).fetchall()
     return len(result) == 1
 
 
-def run_sql_code(database_path: str, code: str) -> None:
+def apply_bulk_write_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply `BULK_WRITE_PRAGMAS` to the SQLite connection `conn`."""
+    for pragma in BULK_WRITE_PRAGMAS:
+        conn.execute(pragma)
+
+
+def connect_to_database(database_path: str) -> sqlite3.Connection:
+    """Open a connection to `database_path` for bulk-appending data.
+
+    The connection is in autocommit mode, such that transactions are managed
+    explicitly, and has `BULK_WRITE_PRAGMAS` applied. It can be passed as
+    `conn` to the functions in this module, to re-use it for several
+    operations on the same database. The caller is responsible for calling
+    `reset_journal_mode` and closing it.
+
+    This is intended for databases written by `graphnet`, e.g., in data
+    conversion, since it switches the database to WAL mode.
+    """
+    conn = sqlite3.connect(database_path, isolation_level=None)
+    apply_bulk_write_pragmas(conn)
+    return conn
+
+
+def reset_journal_mode(conn: sqlite3.Connection) -> None:
+    """Reset the journal mode of the database to `JOURNAL_MODE_DEFAULT`.
+
+    Requires that no other connections to the database are open.
+    """
+    conn.execute(f"PRAGMA journal_mode={JOURNAL_MODE_DEFAULT};")
+
+
+@contextmanager
+def _connection(
+    database_path: str, conn: Optional[sqlite3.Connection] = None
+) -> Iterator[sqlite3.Connection]:
+    """Yield `conn` if provided, otherwise a new, temporary connection.
+
+    No settings are applied to a new connection, such that, e.g., the journal
+    mode of existing databases is left unchanged.
+    """
+    if conn is not None:
+        yield conn
+        return
+
+    conn = sqlite3.connect(database_path, isolation_level=None)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def run_sql_code(
+    database_path: str,
+    code: str,
+    *,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
     """Execute SQLite code.
 
     Args:
         database_path: Path to databases
         code: SQLite code
+        conn: Open connection to `database_path` to use. If None, a new
+            connection is opened and closed again afterwards.
     """
-    conn = sqlite3.connect(database_path)
-    c = conn.cursor()
-    c.executescript(code)
-    c.close()
+    with _connection(database_path, conn) as conn_:
+        c = conn_.cursor()
+        try:
+            c.executescript(code)
+        except Exception:
+            # Leave a re-used connection usable for subsequent calls.
+            if conn_.in_transaction:
+                conn_.execute("ROLLBACK TRANSACTION;")
+            raise
+        finally:
+            c.close()
+
 
+def _get_columns_and_rows(
+    df: Union[pd.DataFrame, Dict[str, List[Any]]]
+) -> Tuple[List[str], Iterable[Tuple[Any, ...]]]:
+    """Return the column names in `df` and an iterator over its rows."""
+    if isinstance(df, pd.DataFrame):
+        return list(df.columns), df.itertuples(index=False, name=None)
+    return list(df.keys()), zip(*df.values())
 
-def save_to_sql(df: pd.DataFrame, table_name: str, database_path: str) -> None:
+
+def save_to_sql(
+    df: Union[pd.DataFrame, Dict[str, List[Any]]],
+    table_name: str,
+    database_path: str,
+    *,
+    conn: Optional[sqlite3.Connection] = None,
+) -> None:
     """Save a dataframe `df` to a table `table_name` in SQLite `database`.
 
-    Table must exist already.
+    Table must exist already. All rows are inserted within a single
+    transaction, using one prepared `INSERT` statement.
 
     Args:
-        df: Dataframe with data to be stored in sqlite table
+        df: Dataframe with data to be stored in sqlite table. Can also be a
+            dictionary mapping column names to lists of equal length, in
+            which case the data is inserted without converting it to a
+            DataFrame first.
         table_name: Name of table. Must exist already
         database_path: Path to SQLite database
+        conn: Open connection to `database_path`, e.g., from
+            `connect_to_database`, to use. If None, a new connection is opened
+            and closed again afterwards.
     """
-    engine = sqlalchemy.create_engine("sqlite:///" + database_path)
-    df.to_sql(table_name, con=engine, index=False, if_exists="append")
-    engine.dispose()
+    column_names, rows = _get_columns_and_rows(df)
+    columns = ", ".join(column_names)
+    placeholders = ", ".join(["?"] * len(column_names))
+    query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders});"
+
+    with _connection(database_path, conn) as conn_:
+        conn_.execute("BEGIN TRANSACTION;")
+        try:
+            conn_.executemany(query, rows)
+            conn_.execute("COMMIT TRANSACTION;")
+        except Exception:
+            # Leave a re-used connection usable for subsequent calls.
+            conn_.execute("ROLLBACK TRANSACTION;")
+            raise
 
 
 def attach_index(
-    database_path: str, table_name: str, index_column: str = "event_no"
+    database_path: str,
+    table_name: str,
+    index_column: str = "event_no",
+    *,
+    analyze: bool = False,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """Attach the table (i.e., event) index.
 
-    Important for query times!
+    Important for query times! Building the index once all rows have been
+    inserted is considerably faster than maintaining it during insertion. The
+    index is sorted in memory, using a larger page cache than for insertion.
+
+    Args:
+        database_path: Path to the database.
+        table_name: Name of the table to index.
+        index_column: Name of the column to index.
+        analyze: Whether to gather statistics on the table for the query
+            planner once the index has been built. Worthwhile for databases
+            that are queried afterwards, but not for temporary ones.
+        conn: Open connection to `database_path` to use. If None, a new
+            connection is opened and closed again afterwards.
     """
     code = (
+        "PRAGMA synchronous=OFF;\n"
+        "PRAGMA temp_store=MEMORY;\n"
+        f"PRAGMA cache_size={INDEX_CACHE_SIZE};\n"
         "PRAGMA foreign_keys=off;\n"
         "BEGIN TRANSACTION;\n"
         f"CREATE INDEX {index_column}_{table_name} "
         f"ON {table_name} ({index_column});\n"
         "COMMIT TRANSACTION;\n"
-        "PRAGMA foreign_keys=on;"
+        + (f"ANALYZE {table_name};\n" if analyze else "")
+        + "PRAGMA foreign_keys=on;"
     )
-    run_sql_code(database_path, code)
+    with _connection(database_path, conn) as conn_:
+        # Restore the settings of the connection afterwards, in case it is
+        # re-used.
+        settings = {
+            pragma: conn_.execute(f"PRAGMA {pragma};").fetchone()[0]
+            for pragma in ("synchronous", "temp_store", "cache_size")
+        }
+        run_sql_code(database_path, code, conn=conn_)
+        for pragma, value in settings.items():
+            conn_.execute(f"PRAGMA {pragma}={value};")
 
 
 def create_table(
@@ -80,6 +248,8 @@ def create_table(
     index_column: str = "event_no",
     default_type: str = "NOT NULL",
     integer_primary_key: bool = True,
+    create_index: bool = True,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
     """Create a table.
 
@@ -96,6 +266,11 @@ def create_table(
             appropriate for pulse map series, particle-level MC truth, and
             other such data that is expected to have more that one row per
             event (i.e., with the same index).
+        create_index: Whether to attach an index on `index_column` to tables
+            without an `INTEGER PRIMARY KEY`. Set to False when inserting
+            large amounts of data, and call `attach_index` once afterwards.
+        conn: Open connection to `database_path` to use. If None, a new
+            connection is opened and closed again afterwards.
     """
     # Prepare column names and types
     query_columns = []
@@ -119,30 +294,49 @@ def create_table(
     run_sql_code(
         database_path,
         code,
+        conn=conn,
     )
 
     # Attaching index to all non-truth-like tables (e.g., pulse maps).
-    if not integer_primary_key:
-        attach_index(database_path, table_name, index_column=index_column)
+    if create_index and not integer_primary_key:
+        attach_index(
+            database_path, table_name, index_column=index_column, conn=conn
+        )
 
 
 def create_table_and_save_to_sql(
-    df: pd.DataFrame,
+    df: Union[pd.DataFrame, Dict[str, List[Any]]],
     table_name: str,
     database_path: str,
     *,
     index_column: str = "event_no",
     default_type: str = "NOT NULL",
     integer_primary_key: bool = True,
+    conn: Optional[sqlite3.Connection] = None,
 ) -> None:
-    """Create table if it doesn't exist and save dataframe to it."""
-    if not database_table_exists(database_path, table_name):
+    """Create table if it doesn't exist and save dataframe to it.
+
+    See `save_to_sql` for the supported types of `df`. If `conn` is provided,
+    all operations use this connection to `database_path`.
+    """
+    new_table = not database_table_exists(database_path, table_name, conn=conn)
+    if new_table:
         create_table(
-            df.columns,
+            list(df.keys()),
             table_name,
             database_path,
             index_column=index_column,
             default_type=default_type,
             integer_primary_key=integer_primary_key,
+            create_index=False,
+            conn=conn,
+        )
+    save_to_sql(
+        df, table_name=table_name, database_path=database_path, conn=conn
+    )
+
+    # Index is built after the initial insert, for speed.
+    if new_table and not integer_primary_key:
+        attach_index(
+            database_path, table_name, index_column=index_column, conn=conn
         )
-    save_to_sql(df, table_name=table_name, database_path=database_path)
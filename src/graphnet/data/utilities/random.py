@@ -1,7 +1,8 @@
 """RNG-related utility functions relevant to the graphnet.data package."""
 
 from typing import List, Tuple
-import pandas as pd
+
+import numpy as np
 
 
 def pairwise_shuffle(
@@ -12,15 +13,15 @@ def pairwise_shuffle(
     This is handy because it ensures a more even extraction load for each worker.
 
     Args:
-        files_list: List of I3 file paths.
+        i3_list: List of I3 file paths.
         gcd_list: List of corresponding gcd file paths.
 
     Returns:
         i3_shuffled: List of shuffled I3 file paths.
         gcd_shuffled: List of corresponding gcd file paths.
     """
-    df = pd.DataFrame({"i3": i3_list, "gcd": gcd_list})
-    df_shuffled = df.sample(frac=1, replace=False)
-    i3_shuffled = df_shuffled["i3"].tolist()
-    gcd_shuffled = df_shuffled["gcd"].tolist()
+    assert len(i3_list) == len(gcd_list)
+    permutation = np.random.permutation(len(i3_list))
+    i3_shuffled = [i3_list[ix] for ix in permutation]
+    gcd_shuffled = [gcd_list[ix] for ix in permutation]
     return i3_shuffled, gcd_shuffled
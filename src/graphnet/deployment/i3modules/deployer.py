@@ -1,12 +1,10 @@
 """Contains the graphnet i3 deployment module."""
 import os.path
 import os
-import random
 import multiprocessing
-from typing import TYPE_CHECKING, List, Union, Sequence
+from typing import TYPE_CHECKING, List, Optional, Union, Sequence
 import time
-import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from graphnet.utilities.imports import has_icecube_package, has_torch_package
 from graphnet.deployment.i3modules import (
@@ -31,6 +29,25 @@ class Settings:
     modules: List[GraphNeTI3Module]
 
 
+# Settings shared by all files processed on a worker. Set once per worker, such
+# that the modules (and any models they hold) aren't sent along with each file.
+_worker_settings: Optional[Settings] = None
+
+
+def _init_worker(settings: Settings) -> None:
+    """Make `settings` available to pool workers."""
+    global _worker_settings
+    _worker_settings = settings
+
+
+def _process_file_on_worker(i3_file: str) -> None:
+    """Process a single I3 file using the settings of the current worker."""
+    assert _worker_settings is not None
+    GraphNeTI3Deployer._process_files(
+        replace(_worker_settings, i3_files=[i3_file])
+    )
+
+
 class GraphNeTI3Deployer:
     """Deploys graphnet i3 modules to i3 files.
 
@@ -70,8 +87,8 @@ class GraphNeTI3Deployer:
 
     def _prepare_settings(
         self, input_files: List[str], output_folder: str
-    ) -> List[Settings]:
-        """Will prepare the settings for each worker."""
+    ) -> Settings:
+        """Will prepare the settings for the workers."""
         try:
             os.makedirs(output_folder)
         except FileExistsError:
@@ -79,59 +96,47 @@ class GraphNeTI3Deployer:
                     existing files, the process has been stopped."""
         if self._n_workers > len(input_files):
             self._n_workers = len(input_files)
-        if self._n_workers > 1:
-            file_batches = np.array_split(input_files, self._n_workers)
-            settings: List[Settings] = []
-            for i in range(self._n_workers):
-                settings.append(
-                    Settings(
-                        file_batches[i],
-                        self._gcd_file,
-                        output_folder,
-                        self._modules,
-                    )
-                )
-        else:
-            settings = [
-                Settings(
-                    input_files,
-                    self._gcd_file,
-                    output_folder,
-                    self._modules,
-                )
-            ]
+
+        # Process the largest files first, such that no worker is left
+        # processing a large file after all other workers have finished.
+        input_files = sorted(input_files, key=os.path.getsize, reverse=True)
+        settings = Settings(
+            input_files,
+            self._gcd_file,
+            output_folder,
+            self._modules,
+        )
         return settings
 
-    def _launch_jobs(self, settings: List[Settings]) -> None:
-        """Will launch jobs in parallel if n_workers > 1, else run on main."""
+    def _launch_jobs(self, settings: Settings) -> None:
+        """Will launch jobs in parallel if n_workers > 1, else run on main.
+
+        When running in parallel, each worker is handed a new file as soon as
+        it finishes the previous one.
+        """
         if self._n_workers > 1:
-            processes = []
-            for i in range(self._n_workers):
-                processes.append(
-                    multiprocessing.Process(
-                        target=self._process_files,
-                        args=[settings[i]],  # type: ignore
-                    )
-                )
-
-            for process in processes:
-                process.start()
-
-            for process in processes:
-                process.join()
+            with multiprocessing.Pool(
+                processes=self._n_workers,
+                initializer=_init_worker,
+                initargs=(settings,),
+            ) as pool:
+                for _ in pool.imap_unordered(
+                    _process_file_on_worker, settings.i3_files, chunksize=1
+                ):
+                    pass
         else:
-            self._process_files(settings[0])
+            self._process_files(settings)
 
+    @staticmethod
     def _process_files(
-        self,
         settings: Settings,
     ) -> None:
         """Will start an IceTray read/write chain with graphnet modules.
 
-        If n_workers > 1, this function is run in parallel n_worker times. Each
-        worker will loop over an allocated set of i3 files. The new i3 files
-        will appear as copies of the original i3 files but with reconstructions
-        added. Original i3 files are left untouched.
+        If n_workers > 1, this function is run on the workers for one i3 file
+        at a time. The new i3 files will appear as copies of the original i3
+        files but with reconstructions added. Original i3 files are left
+        untouched.
         """
         for i3_file in settings.i3_files:
             tray = I3Tray()
@@ -174,9 +179,7 @@ class GraphNeTI3Deployer:
             output_folder: The output folder to which the i3 files are written.
         """
         start_time = time.time()
-        if isinstance(input_files, list):
-            random.shuffle(input_files)
-        else:
+        if not isinstance(input_files, list):
             input_files = [input_files]
         settings = self._prepare_settings(
             input_files=input_files, output_folder=output_folder
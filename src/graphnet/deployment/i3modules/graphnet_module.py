@@ -159,7 +159,8 @@ class I3InferenceModule(GraphNeTI3Module):
             features: the features of the pulsemap that the model is expecting.
             pulsemap_extractor: The extractor used to extract the pulsemap.
             model: The model (or path to pickled model) that will be
-                    used for inference.
+                    used for inference. The model is loaded and set to
+                    evaluation mode once, when the module is constructed.
             model_name: The name used for the model. Will help define the
                         named entry in the I3Frame. E.g. "dynedge".
             prediction_columns: column names for the predictions of the model.
@@ -181,7 +182,10 @@ class I3InferenceModule(GraphNeTI3Module):
         else:
             self.model = model
 
+        # The model is moved to the device and set to evaluation mode once,
+        # such that it can be re-used for all frames in all files.
         self.model.to("cpu")
+        self.model.eval()
 
         if isinstance(prediction_columns, str):
             self.prediction_columns = [prediction_columns]
@@ -232,12 +236,13 @@ class I3InferenceModule(GraphNeTI3Module):
 
     def _inference(self, data: Data) -> np.ndarray:
         # Perform inference
-        task_predictions = self.model(data)
+        with torch.inference_mode():
+            task_predictions = self.model(data)
         assert (
             len(task_predictions) == 1
         ), f"""This method assumes a single task. \n
                Got {len(task_predictions)} tasks."""
-        return self.model(data)[0].detach().numpy()
+        return task_predictions[0].detach().numpy()
 
 
 class I3PulseCleanerModule(I3InferenceModule):
@@ -291,6 +296,7 @@ class I3PulseCleanerModule(I3InferenceModule):
         self._threshold = threshold
         self._predictions_key = f"{pulsemap}_{model_name}_Predictions"
         self._total_pulsemap_name = f"{pulsemap}_{model_name}_Pulses"
+        self._om_geo_map: Dict[Any, Any] = {}
 
     def __call__(self, frame: I3Frame) -> bool:
         """Add a cleaned pulsemap to frame."""
@@ -373,11 +379,14 @@ class I3PulseCleanerModule(I3InferenceModule):
         Returns:
             mDOMMap, DeGGMap, IceCubeMap
         """
-        g = dataio.I3File(gcd_file)
-        gFrame = g.pop_frame()
-        while "I3Geometry" not in gFrame.keys():
+        # The geometry is read from the GCD file only once, not for each frame.
+        if not self._om_geo_map:
+            g = dataio.I3File(gcd_file)
             gFrame = g.pop_frame()
-        omGeoMap = gFrame["I3Geometry"].omgeo
+            while "I3Geometry" not in gFrame.keys():
+                gFrame = g.pop_frame()
+            self._om_geo_map = gFrame["I3Geometry"].omgeo
+        omGeoMap = self._om_geo_map
 
         mDOMMap, DEggMap, IceCubeMap = {}, {}, {}
         pulses = dataclasses.I3RecoPulseSeriesMap.from_frame(
@@ -17,7 +17,11 @@ from torch.utils.data import DataLoader, SequentialSampler
 from torch_geometric.data import Data
 
 from graphnet.utilities.logging import LoggerMixin
-from graphnet.utilities.config import Configurable, ModelConfig
+from graphnet.utilities.config import (
+    Configurable,
+    ModelConfig,
+    load_model_config,
+)
 
 
 class Model(Configurable, LightningModule, LoggerMixin, ABC):
@@ -234,7 +238,7 @@ class Model(Configurable, LightningModule, LoggerMixin, ABC):
     @classmethod
     def load(cls, path: str) -> "Model":
         """Load entire model from `path`."""
-        return torch.load(path, pickle_module=dill)
+        return torch.load(path, pickle_module=dill, map_location="cpu")
 
     def save_state_dict(self, path: str) -> None:
         """Save model `state_dict` to `path`."""
@@ -250,7 +254,7 @@ class Model(Configurable, LightningModule, LoggerMixin, ABC):
     ) -> "Model":  # pylint: disable=arguments-differ
         """Load model `state_dict` from `path`."""
         if isinstance(path, str):
-            state_dict = torch.load(path)
+            state_dict = torch.load(path, map_location="cpu")
         else:
             state_dict = path
         return super().load_state_dict(state_dict)
@@ -276,7 +280,7 @@ class Model(Configurable, LightningModule, LoggerMixin, ABC):
                 `trust = False`.
         """
         if isinstance(source, str):
-            source = ModelConfig.load(source)
+            source = load_model_config(source)
 
         assert isinstance(
             source, ModelConfig
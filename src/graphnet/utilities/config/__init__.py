@@ -2,5 +2,5 @@
 
 from .configurable import Configurable
 from .dataset_config import DatasetConfig, save_dataset_config
-from .model_config import ModelConfig, save_model_config
+from .model_config import ModelConfig, load_model_config, save_model_config
 from .training_config import TrainingConfig
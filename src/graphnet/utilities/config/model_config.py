@@ -1,6 +1,7 @@
 """Config classes for the `graphnet.models` module."""
-from functools import wraps
+from functools import lru_cache, wraps
 import inspect
+import os
 import re
 from typing import (
     TYPE_CHECKING,
@@ -118,9 +119,7 @@ class ModelConfig(BaseConfig):
             exec(f"import {module}", globals())
 
         # Get a lookup for all classes in `graphnet`
-        namespace_classes = get_all_grapnet_classes(
-            graphnet.data, graphnet.models, graphnet.training
-        )
+        namespace_classes = _get_namespace_classes()
 
         # Parse potential ModelConfig arguments
         arguments = dict(**self.arguments)
@@ -226,6 +225,38 @@ class ModelConfig(BaseConfig):
         return {self.__class__.__name__: config_dict}
 
 
+@lru_cache(maxsize=1)
+def _get_namespace_classes() -> Dict[str, type]:
+    """Return a lookup for all classes in `graphnet`.
+
+    Walking all submodules is expensive, so the lookup is only built once per
+    process.
+    """
+    return get_all_grapnet_classes(
+        graphnet.data, graphnet.models, graphnet.training
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_model_config_cached(path: str, mtime: float) -> ModelConfig:
+    """Load `ModelConfig` from `path`, caching the result.
+
+    The modification time `mtime` is part of the cache key, such that the file
+    is parsed again if it changes on disk. The returned instance is shared
+    between calls and should not be modified; use `load_model_config` instead.
+    """
+    config = ModelConfig.load(path)
+    assert isinstance(config, ModelConfig)
+    return config
+
+
+def load_model_config(path: str) -> ModelConfig:
+    """Load `ModelConfig` from `path`, re-using previously parsed files."""
+    path = os.path.abspath(path)
+    config = _load_model_config_cached(path, os.path.getmtime(path))
+    return config.copy(deep=True)
+
+
 def save_model_config(init_fn: Callable) -> Callable:
     """Save the arguments to `__init__` functions as a member `ModelConfig`."""
 
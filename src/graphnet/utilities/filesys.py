@@ -1,33 +1,35 @@
 """File system-related utility functions relevant to the graphnet package."""
 
-from pathlib import Path
+import os
 import re
-from typing import List, Optional, Tuple, Union, cast
+from typing import List, Optional, Tuple, Union
+
+# Extensions of (compressed) I3 files.
+I3_EXTENSIONS = ("bz2", "zst", "gz")
+
+# Pattern identifying GCD files by their name. Also matches "GeoCalibDetector".
+GCD_PATTERN = re.compile("(gcd|geo)", re.IGNORECASE)
 
 
 def is_gcd_file(filename: str) -> bool:
     """Check whether `filename` is a GCD file."""
-    if (
-        re.search("(gcd|geo)", filename.lower())
-        or "GeoCalibDetector" in filename
-    ):
-        return True
-    return False
+    return GCD_PATTERN.search(filename) is not None
 
 
 def is_i3_file(filename: str) -> bool:
     """Check whether `filename` is an I3 file."""
     if is_gcd_file(filename):
         return False
-    elif has_extension(filename, ["bz2", "zst", "gz"]):
+    elif has_extension(filename, I3_EXTENSIONS):
         return True
     return False
 
 
-def has_extension(filename: str, extensions: List[str]) -> bool:
+def has_extension(
+    filename: str, extensions: Union[List[str], Tuple[str, ...]]
+) -> bool:
     """Check whether `filename` has one of the desired extensions."""
-    # @TODO: Remove method, as it is not used?
-    return re.search("(" + "|".join(extensions) + ")$", filename) is not None
+    return filename.endswith(tuple(extensions))
 
 
 def find_i3_files(
@@ -57,20 +59,19 @@ def find_i3_files(
 
     for directory in directories:
 
-        # Recursively find all I3-like files in `directory`.
-        paths = []
-        i3_patterns = ["*.bz2", "*.zst", "*.gz"]
-        for i3_pattern in i3_patterns:
-            paths.extend(list(Path(directory).rglob(i3_pattern)))
+        # Recursively walk `directory` once, visiting each folder in turn.
+        for folder, _, filenames in sorted(os.walk(directory)):
 
-        # Loop over all folders containing such I3-like files.
-        folders = sorted(set([path.parent for path in paths]))
-        for folder in folders:
-
-            # List all I3 and GCD files, respectively, in the current folder.
+            # List all I3-like files in the current folder.
             folder_files = [
-                str(path) for path in paths if path.parent == folder
+                os.path.join(folder, filename)
+                for filename in sorted(filenames)
+                if has_extension(filename, I3_EXTENSIONS)
             ]
+            if len(folder_files) == 0:
+                continue
+
+            # List all I3 and GCD files, respectively, in the current folder.
             folder_i3_files = list(filter(is_i3_file, folder_files))
             folder_gcd_files = list(filter(is_gcd_file, folder_files))
 
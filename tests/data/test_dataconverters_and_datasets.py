@@ -1,8 +1,10 @@
 """Unit tests for DataConverter and Dataset classes."""
 
+from collections import OrderedDict
 import os
 
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 import sqlite3
 import torch
@@ -101,6 +103,59 @@ def test_dataconverter(
     assert os.path.exists(path), path
 
 
+def test_parquet_merge_files_with_different_types(tmpdir: str) -> None:
+    """Test merging Parquet files whose inferred types differ."""
+    converter = ParquetDataConverter(
+        [I3FeatureExtractorIceCube86("SRTInIcePulses")], str(tmpdir)
+    )
+
+    # Integer padding vs. floating point values, an additional field in some
+    # events, and fields in a different order
+    truths = [
+        [{"energy": -1, "event_no": 0}],
+        [{"energy": 2.5, "event_no": 1}],
+        [
+            {"energy": 3.5, "extra": 1, "event_no": 2},
+            {"energy": 4.5, "extra": 2, "event_no": 3},
+        ],
+        [{"event_no": 4, "energy": 5.5}],
+    ]
+    input_files = []
+    for ix, truth in enumerate(truths):
+        data = [
+            OrderedDict(
+                truth=event,
+                SRTInIcePulses={
+                    "dom_x": [1.0] * (event["event_no"] + 1),
+                    "event_no": event["event_no"],
+                },
+            )
+            for event in truth
+        ]
+        input_file = os.path.join(tmpdir, f"input_{ix}.parquet")
+        converter.save_data(data, input_file)
+        input_files.append(input_file)
+
+    output_file = os.path.join(tmpdir, "merged.parquet")
+    converter.merge_files(output_file, input_files)
+
+    merged = pq.read_table(output_file).to_pylist()
+    assert [event["truth"] for event in merged] == [
+        {"energy": -1.0, "event_no": 0, "extra": None},
+        {"energy": 2.5, "event_no": 1, "extra": None},
+        {"energy": 3.5, "event_no": 2, "extra": 1},
+        {"energy": 4.5, "event_no": 3, "extra": 2},
+        {"energy": 5.5, "event_no": 4, "extra": None},
+    ]
+    assert [len(event["SRTInIcePulses"]["dom_x"]) for event in merged] == [
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+
+
 @pytest.mark.order(2)
 @pytest.mark.parametrize("backend", ["sqlite", "parquet"])
 def test_dataset(backend: str) -> None:
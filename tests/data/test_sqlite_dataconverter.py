@@ -0,0 +1,207 @@
+"""Unit tests for `SQLiteDataConverter` without I3 files."""
+
+from collections import OrderedDict
+import os
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+import sqlite3
+
+from graphnet.data.extractors import I3FeatureExtractorIceCube86
+from graphnet.data.sqlite import SQLiteDataConverter
+from graphnet.data.sqlite.sqlite_dataconverter import extend_columns
+
+
+PULSEMAP = "SRTInIcePulses"
+
+
+# Utility method(s)
+def _get_converter(outdir: str, workers: int = 1) -> SQLiteDataConverter:
+    """Return a `SQLiteDataConverter`, without requiring icetray."""
+    return SQLiteDataConverter(
+        [I3FeatureExtractorIceCube86(PULSEMAP)],
+        outdir,
+        workers=workers,
+        icetray_verbose=1,
+    )
+
+
+def _get_table_names(database_path: str) -> List[str]:
+    """Return the names of all tables in database at `database_path`."""
+    conn = sqlite3.connect(database_path)
+    try:
+        return [
+            p[0]
+            for p in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table';"
+            ).fetchall()
+        ]
+    finally:
+        conn.close()
+
+
+def _save_temporary_databases(
+    converter: SQLiteDataConverter, outdir: str, nb_files: int
+) -> List[str]:
+    """Save `nb_files` temporary databases with truth and pulse map tables.
+
+    Every fourth event has an empty pulse map and is not saved.
+    """
+    input_files = []
+    event_no = 0
+    for ix_file in range(nb_files):
+        data = []
+        for _ in range(10):
+            nb_pulses = event_no % 4
+            data.append(
+                OrderedDict(
+                    truth={"event_no": event_no, "energy": 1.0 * event_no},
+                    **{
+                        PULSEMAP: {
+                            "event_no": event_no,
+                            "dom_x": [1.0] * nb_pulses,
+                            "charge": list(range(nb_pulses)),
+                        }
+                    },
+                )
+            )
+            event_no += 1
+        input_file = os.path.join(outdir, f"temporary_{ix_file}.db")
+        converter.save_data(data, input_file)
+        input_files.append(input_file)
+    return input_files
+
+
+# Unit test(s)
+def test_extend_columns() -> None:
+    """Test collecting extractions column-wise with `extend_columns`."""
+    columns: Dict[str, List[Any]] = {}
+    nb_rows = 0
+
+    # Scalar-only extraction, e.g., event-level truth
+    nb_rows += extend_columns(columns, nb_rows, {"event_no": 0, "x": 1.0})
+    assert nb_rows == 1
+    assert columns == {"event_no": [0], "x": [1.0]}
+
+    # Scalars are repeated for each pulse; column `y` is missing in earlier
+    # events and column `x` is missing in this event
+    nb_rows += extend_columns(columns, nb_rows, {"event_no": 1, "y": [2, 3]})
+    assert nb_rows == 3
+    assert columns == {
+        "event_no": [0, 1, 1],
+        "x": [1.0, None, None],
+        "y": [None, 2, 3],
+    }
+
+    # Zero-length extraction, e.g., an empty pulse map, adds no rows
+    assert extend_columns(columns, nb_rows, {"event_no": 2, "y": []}) == 0
+    assert all(len(values) == nb_rows for values in columns.values())
+
+    # Column `y` is missing in later events
+    nb_rows += extend_columns(columns, nb_rows, {"event_no": 3, "x": (4.0,)})
+    assert nb_rows == 4
+    assert columns == {
+        "event_no": [0, 1, 1, 3],
+        "x": [1.0, None, None, 4.0],
+        "y": [None, 2, 3, None],
+    }
+
+    # NumPy arrays are treated as sequences, and NumPy scalars as scalars
+    nb_rows += extend_columns(
+        columns,
+        nb_rows,
+        {"event_no": np.int64(4), "y": np.array([5, 6])},
+    )
+    assert nb_rows == 6
+    assert columns == {
+        "event_no": [0, 1, 1, 3, 4, 4],
+        "x": [1.0, None, None, 4.0, None, None],
+        "y": [None, 2, 3, None, 5, 6],
+    }
+
+
+def test_extend_columns_unequal_lengths() -> None:
+    """Test that lists of different lengths in an extraction are rejected."""
+    with pytest.raises(AssertionError):
+        extend_columns({}, 0, {"x": [1.0, 2.0], "y": [1.0]})
+    with pytest.raises(AssertionError):
+        extend_columns({}, 0, {"x": np.zeros(2), "y": [1.0]})
+
+
+@pytest.mark.parametrize(
+    "value", [{"a": 1.0}, {1.0}, np.zeros((2, 2)), object()]
+)
+def test_extend_columns_invalid_values(value: Any) -> None:
+    """Test that values neither sequences nor scalars are rejected."""
+    columns: Dict[str, List[Any]] = {}
+    with pytest.raises(AssertionError):
+        extend_columns(columns, 0, {"event_no": 0, "x": value})
+    assert columns == {}
+
+
+def test_internal_tables_are_not_merged(tmpdir: str) -> None:
+    """Test that only internal `sqlite_*` tables are skipped when merging."""
+    input_file = os.path.join(tmpdir, "input.db")
+    conn = sqlite3.connect(input_file)
+    conn.executescript(
+        "CREATE TABLE sqlite3x (event_no INTEGER, value FLOAT);\n"
+        "CREATE INDEX event_no_sqlite3x ON sqlite3x (event_no);\n"
+        "INSERT INTO sqlite3x VALUES (0, 1.0), (1, 2.0), (2, 3.0);\n"
+        "ANALYZE;"
+    )
+    conn.close()
+    assert "sqlite_stat1" in _get_table_names(input_file)
+
+    output_file = os.path.join(tmpdir, "merged.db")
+    _get_converter(str(tmpdir)).merge_files(output_file, [input_file])
+
+    assert "sqlite3x" in _get_table_names(output_file)
+    conn = sqlite3.connect(output_file)
+    try:
+        nb_rows = conn.execute("SELECT COUNT(*) FROM sqlite3x;").fetchone()[0]
+    finally:
+        conn.close()
+    assert nb_rows == 3
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_merge_files(tmpdir: str, workers: int) -> None:
+    """Test merging temporary databases."""
+    outdir = str(tmpdir)
+    converter = _get_converter(outdir, workers=workers)
+    input_files = _save_temporary_databases(converter, outdir, nb_files=7)
+
+    output_file = os.path.join(outdir, "merged.db")
+    converter.merge_files(output_file, input_files)
+
+    # No other files are left behind
+    assert sorted(os.listdir(outdir)) == sorted(
+        [os.path.basename(path) for path in input_files + [output_file]]
+    )
+
+    conn = sqlite3.connect(output_file)
+    try:
+        # Events with an empty pulse map are not saved
+        event_nos = [event_no for event_no in range(70) if event_no % 4]
+        assert conn.execute(
+            "SELECT COUNT(*), SUM(event_no) FROM truth;"
+        ).fetchone() == (len(event_nos), sum(event_nos))
+        assert conn.execute(
+            f"SELECT COUNT(*), SUM(event_no) FROM {PULSEMAP};"
+        ).fetchone() == (
+            sum(event_no % 4 for event_no in event_nos),
+            sum(event_no * (event_no % 4) for event_no in event_nos),
+        )
+
+        # Pulse map is indexed on `event_no`
+        query_plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM {PULSEMAP} WHERE event_no=1;"
+        ).fetchall()
+        assert f"USING INDEX event_no_{PULSEMAP}" in query_plan[0][-1]
+
+        # Merged database is not left in WAL mode
+        journal_mode = conn.execute("PRAGMA journal_mode;").fetchone()[0]
+        assert journal_mode == "delete"
+    finally:
+        conn.close()
@@ -0,0 +1,145 @@
+"""Unit tests for SQLite utility functions."""
+
+import os
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+import sqlite3
+
+from graphnet.data.sqlite.sqlite_utilities import (
+    connect_to_database,
+    create_table_and_save_to_sql,
+    save_to_sql,
+)
+
+
+def _get_values_and_types(
+    database_path: str, table_name: str, column: str
+) -> List[Any]:
+    """Return the values in `column` and their SQLite storage classes."""
+    conn = sqlite3.connect(database_path)
+    try:
+        return conn.execute(
+            f"SELECT {column}, typeof({column}) FROM {table_name} "
+            "ORDER BY event_no;"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def test_save_numpy_scalars(tmpdir: str) -> None:
+    """Test that NumPy scalars are stored as numbers, not BLOBs."""
+    database_path = os.path.join(tmpdir, "numpy_scalars.db")
+    columns: Dict[str, List[Any]] = {
+        "event_no": [np.int64(0), np.int64(1)],
+        "stopped_muon": [np.bool_(True), np.bool_(False)],
+        "energy": [np.float32(1.5), np.float64(2.5)],
+        "pid": [np.int32(13), np.uint8(1)],
+    }
+    create_table_and_save_to_sql(columns, "truth", database_path)
+
+    assert _get_values_and_types(database_path, "truth", "event_no") == [
+        (0, "integer"),
+        (1, "integer"),
+    ]
+    assert _get_values_and_types(database_path, "truth", "stopped_muon") == [
+        (1, "integer"),
+        (0, "integer"),
+    ]
+    assert _get_values_and_types(database_path, "truth", "energy") == [
+        (1.5, "real"),
+        (2.5, "real"),
+    ]
+    assert _get_values_and_types(database_path, "truth", "pid") == [
+        (13, "integer"),
+        (1, "integer"),
+    ]
+
+
+def test_save_dataframe_with_numpy_and_missing_values(tmpdir: str) -> None:
+    """Test saving DataFrames with object and nullable extension dtypes."""
+    database_path = os.path.join(tmpdir, "dataframe.db")
+    df = pd.DataFrame(
+        {
+            "event_no": [0, 1, 2],
+            "stopped_muon": [np.bool_(True), -1, np.bool_(False)],
+            "pid": pd.array([13, None, 14], dtype="Int64"),
+        }
+    )
+    assert df["stopped_muon"].dtype == object
+    create_table_and_save_to_sql(
+        df, "truth", database_path, default_type="INTEGER"
+    )
+
+    assert _get_values_and_types(database_path, "truth", "stopped_muon") == [
+        (1, "integer"),
+        (-1, "integer"),
+        (0, "integer"),
+    ]
+    assert _get_values_and_types(database_path, "truth", "pid") == [
+        (13, "integer"),
+        (None, "null"),
+        (14, "integer"),
+    ]
+
+
+def test_journal_mode_of_existing_database_is_unchanged(tmpdir: str) -> None:
+    """Test that adding a table to an existing database keeps its settings."""
+    database_path = os.path.join(tmpdir, "existing.db")
+    conn = sqlite3.connect(database_path)
+    conn.execute("CREATE TABLE truth (event_no INTEGER PRIMARY KEY);")
+    conn.close()
+
+    create_table_and_save_to_sql(
+        {"event_no": [0, 0, 1], "weight": [1.0, 2.0, 3.0]},
+        "weights",
+        database_path,
+        integer_primary_key=False,
+    )
+
+    conn = sqlite3.connect(database_path)
+    try:
+        journal_mode = conn.execute("PRAGMA journal_mode;").fetchone()[0]
+    finally:
+        conn.close()
+    assert journal_mode == "delete"
+
+
+def test_connection_is_usable_after_failed_insert(tmpdir: str) -> None:
+    """Test that a failed insert is rolled back on a re-used connection."""
+    database_path = os.path.join(tmpdir, "failed_insert.db")
+    conn = connect_to_database(database_path)
+    try:
+        create_table_and_save_to_sql(
+            {"event_no": [0, 1], "energy": [1.0, 2.0]},
+            "truth",
+            database_path,
+            conn=conn,
+        )
+
+        # Duplicate primary key; no rows from this call should be kept.
+        with pytest.raises(sqlite3.IntegrityError):
+            save_to_sql(
+                {"event_no": [2, 0], "energy": [3.0, 4.0]},
+                "truth",
+                database_path,
+                conn=conn,
+            )
+        assert not conn.in_transaction
+
+        save_to_sql(
+            {"event_no": [2], "energy": [3.0]},
+            "truth",
+            database_path,
+            conn=conn,
+        )
+    finally:
+        conn.close()
+
+    assert _get_values_and_types(database_path, "truth", "event_no") == [
+        (0, "integer"),
+        (1, "integer"),
+        (2, "integer"),
+    ]
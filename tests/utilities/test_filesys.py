@@ -1,6 +1,12 @@
 """Unit tests for file system utility methods."""
 
-from graphnet.utilities.filesys import is_i3_file, has_extension
+import os
+
+from graphnet.utilities.filesys import (
+    find_i3_files,
+    is_i3_file,
+    has_extension,
+)
 
 
 def test_is_i3_file() -> None:
@@ -24,3 +30,27 @@ def test_has_extension() -> None:
     assert has_extension("path/to/file.zst", extensions) is True
     assert has_extension("path/to/file.zst.txt", extensions) is False
     assert has_extension("path/to/file_gz.csv", extensions) is False
+
+
+def test_find_i3_files(tmpdir: str) -> None:
+    """Test `find_i3_files` function."""
+    # Create a directory tree with and without GCD files
+    folder_with_gcd = os.path.join(tmpdir, "first")
+    folder_without_gcd = os.path.join(tmpdir, "second", "sub")
+    os.makedirs(folder_with_gcd)
+    os.makedirs(folder_without_gcd)
+    filenames = [
+        os.path.join(folder_with_gcd, "GeoCalibDetectorStatus.i3.gz"),
+        os.path.join(folder_with_gcd, "file_0.i3.zst"),
+        os.path.join(folder_with_gcd, "file_1.i3.bz2"),
+        os.path.join(folder_with_gcd, "notes.txt"),
+        os.path.join(folder_without_gcd, "file_2.i3.gz"),
+    ]
+    for filename in filenames:
+        open(filename, "w").close()
+
+    gcd_rescue = "path/to/rescue_gcd.i3.gz"
+    i3_files, gcd_files = find_i3_files(str(tmpdir), gcd_rescue)
+
+    assert i3_files == [filenames[1], filenames[2], filenames[4]]
+    assert gcd_files == [filenames[0], filenames[0], gcd_rescue]
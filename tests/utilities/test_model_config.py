@@ -6,7 +6,7 @@ import torch
 from torch.optim.adam import Adam
 
 from graphnet.models import StandardModel, Model
-from graphnet.utilities.config import ModelConfig
+from graphnet.utilities.config import ModelConfig, load_model_config
 from graphnet.models.detector.icecube import IceCubeDeepCore
 from graphnet.models.gnn import DynEdge
 from graphnet.models.graph_builders import KNNGraphBuilder
@@ -143,4 +143,46 @@ def test_complete_model_config(path: str = "/tmp/complete_model.yml") -> None:
     assert repr(constructed_model) == repr(model)
 
 
+def test_load_model_config_returns_copies(
+    path: str = "/tmp/cached_model.yml",
+) -> None:
+    """Test that repeated loads return equal, but independent, configs."""
+    model = DynEdge(
+        nb_inputs=9,
+        global_pooling_schemes=["min", "max", "mean", "sum"],
+    )
+    model.save_config(path)
+
+    loaded_config = load_model_config(path)
+    reloaded_config = load_model_config(path)
+    assert loaded_config == model.config
+    assert reloaded_config == loaded_config
+    assert reloaded_config is not loaded_config
+    assert reloaded_config.arguments is not loaded_config.arguments
+
+    # Modifying a loaded config does not affect subsequent loads
+    loaded_config.arguments["global_pooling_schemes"].append("min")
+    assert load_model_config(path) == model.config
+
+
+def test_load_model_config_reloads_edited_file(
+    path: str = "/tmp/edited_model.yml",
+) -> None:
+    """Test that a config file is read again once it is modified."""
+    model = DynEdge(nb_inputs=9, global_pooling_schemes=["max"])
+    model.save_config(path)
+    assert load_model_config(path) == model.config
+
+    # Overwrite file, ensuring that the modification time changes even on file
+    # systems with coarse timestamps
+    mtime = os.path.getmtime(path)
+    edited_model = DynEdge(nb_inputs=7, global_pooling_schemes=["max"])
+    edited_model.save_config(path)
+    os.utime(path, (mtime + 1, mtime + 1))
+
+    loaded_config = load_model_config(path)
+    assert loaded_config == edited_model.config
+    assert loaded_config.arguments["nb_inputs"] == 7
+
+
 test_complete_model_config()